@@ -3,25 +3,23 @@ import os
 from datetime import datetime
 from scraper.core.db import get_db
 
+SYMBOL_BATCH_SIZE = 1000
+
+_URL_TMPL = (
+    "  <url>\n"
+    "    <loc>{base}{path}</loc>\n"
+    "    <changefreq>weekly</changefreq>\n"
+    "    <priority>{priority}</priority>\n"
+    "  </url>"
+)
+
 async def generate_assets():
     print("Generating SEO assets...")
     db = get_db()
     registry_col = db["companies_registry"]
     
-    # Get all symbols
-    cursor = registry_col.find({}, {"symbol": 1})
-    symbols = []
-    async for doc in cursor:
-        symbols.append(doc["symbol"])
-    
-    print(f"Found {len(symbols)} symbols in registry.")
-    
     # 1. Generate Sitemap
     base_url = "https://fundametrics.in"
-    sitemap_content = [
-        '<?xml version="1.0" encoding="UTF-8"?>',
-        '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
-    ]
     
     # Static pages
     static_pages = [
@@ -32,32 +30,39 @@ async def generate_assets():
         ("/disclaimer", 0.5)
     ]
     
-    for page, priority in static_pages:
-        sitemap_content.append(f"  <url>")
-        sitemap_content.append(f"    <loc>{base_url}{page}</loc>")
-        sitemap_content.append(f"    <changefreq>weekly</changefreq>")
-        sitemap_content.append(f"    <priority>{priority}</priority>")
-        sitemap_content.append(f"  </url>")
-    
-    # Company pages
-    for symbol in symbols:
-        sitemap_content.append(f"  <url>")
-        sitemap_content.append(f"    <loc>{base_url}/stocks/{symbol}</loc>")
-        sitemap_content.append(f"    <changefreq>weekly</changefreq>")
-        sitemap_content.append(f"    <priority>0.7</priority>")
-        sitemap_content.append(f"  </url>")
-        
-    sitemap_content.append("</urlset>")
-    
-    # Write Sitemap
     frontend_public = os.path.abspath("../finox-frontend/public")
     if not os.path.exists(frontend_public):
         # Fallback if structure is different
         frontend_public = os.path.abspath("c:/Users/Laser cote/.gemini/antigravity/scratch/finox-frontend/public")
 
+    # Company pages are streamed from a projection-only cursor straight into the
+    # file, one write per batch, so the symbol list is never held in memory
+    cursor = registry_col.find({}, {"symbol": 1, "_id": 0}).batch_size(SYMBOL_BATCH_SIZE)
+    fmt = _URL_TMPL.format
+    count = 0
+    
     sitemap_path = os.path.join(frontend_public, "sitemap.xml")
     with open(sitemap_path, "w", encoding="utf-8") as f:
-        f.write("\n".join(sitemap_content))
+        f.write("\n".join([
+            '<?xml version="1.0" encoding="UTF-8"?>',
+            '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">',
+            *(fmt(base=base_url, path=page, priority=priority) for page, priority in static_pages),
+        ]))
+        
+        chunk = []
+        async for doc in cursor:
+            chunk.append(fmt(base=base_url, path=f"/stocks/{doc['symbol']}", priority=0.7))
+            if len(chunk) >= SYMBOL_BATCH_SIZE:
+                f.write("\n" + "\n".join(chunk))
+                count += len(chunk)
+                chunk = []
+        if chunk:
+            f.write("\n" + "\n".join(chunk))
+            count += len(chunk)
+        
+        f.write("\n</urlset>")
+    
+    print(f"Found {count} symbols in registry.")
     print(f"✓ Sitemap generated at {sitemap_path}")
     
     # 2. Generate Robots.txt